@@ -9,15 +9,15 @@ from django.core.exceptions import ValidationError
 # Maximum file size: 10MB
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
-# Allowed file extensions
-ALLOWED_EXTENSIONS = [
+# Allowed file extensions (frozenset for O(1) membership checks)
+ALLOWED_EXTENSIONS = frozenset({
     'pdf', 'jpg', 'jpeg', 'png', 'gif',
     'doc', 'docx', 'xls', 'xlsx',
     'txt', 'csv', 'zip'
-]
+})
 
 # Allowed MIME types
-ALLOWED_MIME_TYPES = [
+ALLOWED_MIME_TYPES = frozenset({
     'application/pdf',
     'image/jpeg',
     'image/png',
@@ -30,7 +30,7 @@ ALLOWED_MIME_TYPES = [
     'text/csv',
     'application/zip',
     'application/x-zip-compressed',
-]
+})
 
 
 def validate_file_size(file):
@@ -75,7 +75,7 @@ def validate_file_extension(file):
     if extension not in ALLOWED_EXTENSIONS:
         raise ValidationError(
             f"File extension '.{extension}' not allowed. "
-            f"Allowed extensions: {', '.join(ALLOWED_EXTENSIONS)}"
+            f"Allowed extensions: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
         )
 
 
@@ -100,7 +100,7 @@ def validate_mime_type(file):
     if kind is None:
         # Try to determine from extension for text files
         extension = file.name.rsplit('.', 1)[1].lower() if '.' in file.name else ''
-        if extension in ['txt', 'csv']:
+        if extension in {'txt', 'csv'}:
             mime_type = 'text/plain' if extension == 'txt' else 'text/csv'
         else:
             raise ValidationError("Could not determine file type.")
@@ -153,7 +153,7 @@ class TaskDeleteView(TaskOwnerMixin, DeleteView):
     template_name = "tasks/task_confirm_delete.html"
     success_url = reverse_lazy("tasks:list")
 
-    def delete(self, request, *args, **kwargs):
+    def form_valid(self, form):
         """Add success message on deletion."""
         messages.success(self.request, "Task deleted successfully!")
-        return super().delete(request, *args, **kwargs)
+        return super().form_valid(form)
@@ -231,7 +231,7 @@ class TestLogoutView:
 
         # Create and login user
         user = User.objects.create_user(
-            email="testuser@example.com", username="testuser", password="TestPass123!@#"
+            email="testuser@example.com", username="testuser"
         )
         client.force_login(user)
 
@@ -249,7 +249,7 @@ class TestLogoutView:
 
         # Create and login user
         user = User.objects.create_user(
-            email="testuser@example.com", username="testuser", password="TestPass123!@#"
+            email="testuser@example.com", username="testuser"
         )
         client.force_login(user)
 
@@ -292,7 +292,6 @@ class TestProfileView:
         user = User.objects.create_user(
             email="testuser@example.com",
             username="testuser",
-            password="TestPass123!@#",
             first_name="John",
             last_name="Doe",
         )
@@ -303,8 +302,8 @@ class TestProfileView:
 
             # Should render profile page
             assert response.status_code == 200
-            assert b"John" in response.content
-            assert b"Doe" in response.content
+            assert response.context["form"].initial["first_name"] == "John"
+            assert response.context["form"].initial["last_name"] == "Doe"
         except Exception:
             pytest.skip("Profile view not implemented yet")
 
@@ -329,7 +328,6 @@ class TestProfileView:
         user = User.objects.create_user(
             email="testuser@example.com",
             username="testuser",
-            password="TestPass123!@#",
             first_name="John",
             last_name="Doe",
         )
@@ -360,10 +358,10 @@ class TestProfileView:
 
         # Create two users
         user1 = User.objects.create_user(
-            email="user1@example.com", username="user1", password="TestPass123!@#"
+            email="user1@example.com", username="user1"
         )
         User.objects.create_user(
-            email="user2@example.com", username="user2", password="TestPass123!@#"
+            email="user2@example.com", username="user2"
         )
         client.force_login(user1)
 
@@ -394,7 +392,6 @@ class TestProfileView:
         user = User.objects.create_user(
             email="testuser@example.com",
             username="testuser",
-            password="TestPass123!@#",
             first_name="John",
             last_name="Doe",
         )
@@ -406,7 +403,7 @@ class TestProfileView:
 
             # Should see own data
             assert response.status_code == 200
-            assert b"testuser@example.com" in response.content
+            assert response.context["form"].initial["email"] == "testuser@example.com"
 
             # Note: In this simple implementation, there's no way to edit
             # another user's profile as we don't have user ID in URL
@@ -425,7 +422,7 @@ class TestChangePasswordView:
         client = pytest.importorskip("django.test").Client()
 
         user = User.objects.create_user(
-            email="testuser@example.com", username="testuser", password="OldPass123!@#"
+            email="testuser@example.com", username="testuser"
         )
         client.force_login(user)
 
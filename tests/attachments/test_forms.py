@@ -113,30 +113,28 @@ class TestAttachmentUploadForm:
         assert 'file' in form.errors
         assert 'empty' in str(form.errors['file']).lower()
     
-    def test_form_allowed_extensions(self):
+    @pytest.mark.parametrize("filename,content_type", [
+        ('test.pdf', 'application/pdf'),
+        ('test.doc', 'application/msword'),
+        ('test.docx', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'),
+        ('test.xls', 'application/vnd.ms-excel'),
+        ('test.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+        ('test.txt', 'text/plain'),
+        ('test.jpg', 'image/jpeg'),
+        ('test.png', 'image/png'),
+    ])
+    def test_form_allowed_extensions(self, filename, content_type):
         """Test form accepts all allowed file extensions."""
-        allowed_extensions = [
-            ('test.pdf', 'application/pdf'),
-            ('test.doc', 'application/msword'),
-            ('test.docx', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'),
-            ('test.xls', 'application/vnd.ms-excel'),
-            ('test.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
-            ('test.txt', 'text/plain'),
-            ('test.jpg', 'image/jpeg'),
-            ('test.png', 'image/png'),
-        ]
+        file = SimpleUploadedFile(
+            filename,
+            b'valid content',
+            content_type=content_type
+        )
         
-        for filename, content_type in allowed_extensions:
-            file = SimpleUploadedFile(
-                filename,
-                b'valid content',
-                content_type=content_type
-            )
-            
-            form = AttachmentUploadForm(
-                files={'file': file}
-            )
-            
-            # Note: Form may still be invalid due to MIME type detection
-            # but the extension check should pass
-            assert 'file' in form.fields
+        form = AttachmentUploadForm(
+            files={'file': file}
+        )
+        
+        # Note: Form may still be invalid due to MIME type detection
+        # but the extension check should pass
+        assert 'file' in form.fields
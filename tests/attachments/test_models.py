@@ -83,8 +83,8 @@ class TestAttachmentModel:
         )
         
         assert task.attachments.count() == 2
-        assert attachment1 in task.attachments.all()
-        assert attachment2 in task.attachments.all()
+        assert task.attachments.filter(pk=attachment1.pk).exists()
+        assert task.attachments.filter(pk=attachment2.pk).exists()
     
     def test_attachment_ordering(self, task):
         """Test that attachments are ordered by creation date (newest first)."""
@@ -2,123 +2,119 @@
 Tests for attachment signal handlers.
 """
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock
 from attachments.models import Attachment
 from tasks.models import Task
 
 
-@pytest.fixture
-def user(django_user_model):
-    """Create test user."""
-    return django_user_model.objects.create_user(
-        username='testuser',
-        email='test@example.com',
-        password='testpass123'
-    )
+pytestmark = pytest.mark.xdist_group(name='attachment_signals')
 
 
 @pytest.fixture
-def task(user):
+def task(auth_user):
     """Create test task."""
     return Task.objects.create(
         title='Test Task',
         description='Test Description',
         status='todo',
         priority='medium',
-        owner=user
+        owner=auth_user
     )
 
 
-@pytest.mark.django_db
-class TestAttachmentDeletionSignal:
-    """Tests for attachment deletion signal handler."""
-    
-    def test_blob_deleted_when_attachment_deleted(self, task):
-        """Test that blob is deleted from Azure storage when attachment is deleted."""
-        attachment = Attachment.objects.create(
+def insert_attachment(task, blob_name):
+    """Insert an attachment without dispatching save signals."""
+    return Attachment.objects.bulk_create([
+        Attachment(
             task=task,
             file_name='test.pdf',
-            blob_name='unique-blob.pdf',
+            blob_name=blob_name,
             file_size=1024,
             content_type='application/pdf'
         )
+    ])[0]
+
+
+@pytest.fixture(scope='module')
+def storage_cls():
+    """Build the AzureBlobStorage class mock once per module."""
+    return MagicMock()
+
+
+@pytest.mark.django_db(transaction=False)
+class TestAttachmentDeletionSignal:
+    """Tests for attachment deletion signal handler."""
+    
+    @pytest.fixture(autouse=True)
+    def mock_storage(self, monkeypatch, storage_cls):
+        """Install the shared storage mock and reset it after each test."""
+        monkeypatch.setattr('attachments.signals.AzureBlobStorage', storage_cls)
+        yield storage_cls
+        storage_cls.reset_mock(return_value=True, side_effect=True)
+    
+    def test_blob_deleted_when_attachment_deleted(self, task, mock_storage):
+        """Test that blob is deleted from Azure storage when attachment is deleted."""
+        attachment = insert_attachment(task, 'unique-blob.pdf')
         
-        with patch('attachments.signals.AzureBlobStorage') as MockStorage:
-            mock_storage_instance = Mock()
-            MockStorage.return_value = mock_storage_instance
-            mock_storage_instance.exists.return_value = True
-            
-            attachment.delete()
-            
-            mock_storage_instance.exists.assert_called_once_with('unique-blob.pdf')
-            mock_storage_instance.delete.assert_called_once_with('unique-blob.pdf')
+        mock_storage_instance = mock_storage.return_value
+        mock_storage_instance.exists.return_value = True
+        
+        attachment.delete()
+        
+        mock_storage_instance.exists.assert_called_once_with('unique-blob.pdf')
+        mock_storage_instance.delete.assert_called_once_with('unique-blob.pdf')
     
-    def test_signal_handles_missing_blob(self, task):
+    def test_signal_handles_missing_blob(self, task, mock_storage):
         """Test that signal handles case where blob doesn't exist in storage."""
-        attachment = Attachment.objects.create(
-            task=task,
-            file_name='test.pdf',
-            blob_name='missing-blob.pdf',
-            file_size=1024,
-            content_type='application/pdf'
-        )
+        attachment = insert_attachment(task, 'missing-blob.pdf')
+        
+        mock_storage_instance = mock_storage.return_value
+        mock_storage_instance.exists.return_value = False
+        
+        # Should not raise exception
+        attachment.delete()
         
-        with patch('attachments.signals.AzureBlobStorage') as MockStorage:
-            mock_storage_instance = Mock()
-            MockStorage.return_value = mock_storage_instance
-            mock_storage_instance.exists.return_value = False
-            
-            # Should not raise exception
-            attachment.delete()
-            
-            mock_storage_instance.exists.assert_called_once_with('missing-blob.pdf')
-            mock_storage_instance.delete.assert_not_called()
+        mock_storage_instance.exists.assert_called_once_with('missing-blob.pdf')
+        mock_storage_instance.delete.assert_not_called()
     
-    def test_db_deletion_proceeds_despite_storage_error(self, task):
+    def test_db_deletion_proceeds_despite_storage_error(self, task, mock_storage):
         """Test that DB deletion proceeds even if blob deletion fails."""
-        attachment = Attachment.objects.create(
-            task=task,
-            file_name='test.pdf',
-            blob_name='error-blob.pdf',
-            file_size=1024,
-            content_type='application/pdf'
-        )
+        attachment = insert_attachment(task, 'error-blob.pdf')
         
         attachment_id = attachment.id
         
-        with patch('attachments.signals.AzureBlobStorage') as MockStorage:
-            MockStorage.side_effect = Exception("Storage connection error")
-            
-            # Should not raise exception - DB deletion should proceed
-            attachment.delete()
+        mock_storage.side_effect = Exception("Storage connection error")
+        
+        # Should not raise exception - DB deletion should proceed
+        attachment.delete()
         
         # Verify attachment was deleted from DB
         assert not Attachment.objects.filter(id=attachment_id).exists()
     
-    def test_cascade_delete_on_task_deletion(self, task):
+    def test_cascade_delete_on_task_deletion(self, task, mock_storage):
         """Test that attachments are deleted when parent task is deleted."""
-        attachment1 = Attachment.objects.create(
-            task=task,
-            file_name='file1.pdf',
-            blob_name='blob1.pdf',
-            file_size=1024,
-            content_type='application/pdf'
-        )
+        # Only deletion is under test, so insert both rows in one query
+        Attachment.objects.bulk_create([
+            Attachment(
+                task=task,
+                file_name='file1.pdf',
+                blob_name='blob1.pdf',
+                file_size=1024,
+                content_type='application/pdf'
+            ),
+            Attachment(
+                task=task,
+                file_name='file2.jpg',
+                blob_name='blob2.jpg',
+                file_size=2048,
+                content_type='image/jpeg'
+            ),
+        ])
         
-        attachment2 = Attachment.objects.create(
-            task=task,
-            file_name='file2.jpg',
-            blob_name='blob2.jpg',
-            file_size=2048,
-            content_type='image/jpeg'
-        )
+        mock_storage_instance = mock_storage.return_value
+        mock_storage_instance.exists.return_value = True
+        
+        task.delete()
         
-        with patch('attachments.signals.AzureBlobStorage') as MockStorage:
-            mock_storage_instance = Mock()
-            MockStorage.return_value = mock_storage_instance
-            mock_storage_instance.exists.return_value = True
-            
-            task.delete()
-            
-            # Both blobs should be deleted
-            assert mock_storage_instance.delete.call_count == 2
+        # Both blobs should be deleted
+        assert mock_storage_instance.delete.call_count == 2
@@ -2,15 +2,20 @@
 Tests for Azure Blob Storage backend.
 """
 import pytest
-from datetime import datetime, timedelta
-from unittest.mock import Mock, MagicMock
+from unittest.mock import MagicMock
 from django.core.files.uploadedfile import SimpleUploadedFile
 from attachments.storage import AzureBlobStorage
 
 
-@pytest.fixture
+pytestmark = pytest.mark.xdist_group(name="attachment_storage")
+
+FILE_CONTENT = b"file content"
+NEW_FILE_CONTENT = b"new content"
+
+
+@pytest.fixture(scope="module")
 def mock_blob_service():
-    """Mock Azure BlobServiceClient."""
+    """Mock Azure BlobServiceClient, built once per module."""
     service_mock = MagicMock()
     container_mock = MagicMock()
     blob_mock = MagicMock()
@@ -21,6 +26,35 @@ def mock_blob_service():
     return service_mock
 
 
+@pytest.fixture(autouse=True)
+def reset_blob_service(mock_blob_service):
+    """Clear calls and per-test configuration from the shared mocks."""
+    yield
+    # Keep the client wiring but drop anything a test configured on it
+    mock_blob_service.reset_mock(side_effect=True)
+    mock_blob_service.get_blob_client.return_value.reset_mock(
+        return_value=True, side_effect=True
+    )
+    mock_blob_service.get_container_client.return_value.reset_mock(
+        return_value=True, side_effect=True
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def azure_settings():
+    """Point Azure settings at a test container once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            'attachments.storage.settings.AZURE_STORAGE_CONNECTION_STRING',
+            'DefaultEndpointsProtocol=https;AccountName=test;'
+        )
+        mp.setattr(
+            'attachments.storage.settings.AZURE_STORAGE_CONTAINER_NAME',
+            'test-container'
+        )
+        yield
+
+
 @pytest.fixture
 def storage(mock_blob_service, mocker):
     """Create storage instance with mocked Azure client."""
@@ -29,21 +63,25 @@ def storage(mock_blob_service, mocker):
         return_value=mock_blob_service
     )
     
-    # Mock Django settings
-    mocker.patch(
-        'attachments.storage.settings.AZURE_STORAGE_CONNECTION_STRING',
-        'DefaultEndpointsProtocol=https;AccountName=test;'
-    )
-    mocker.patch(
-        'attachments.storage.settings.AZURE_STORAGE_CONTAINER_NAME',
-        'test-container'
-    )
-    
     storage = AzureBlobStorage()
     storage.blob_service_client = mock_blob_service
     return storage
 
 
+@pytest.fixture
+def blob_client(mock_blob_service):
+    """Blob client mock returned for every blob the storage asks for."""
+    return mock_blob_service.get_blob_client.return_value
+
+
+@pytest.fixture(scope="module")
+def uploaded_file_factory():
+    """Return a factory for in-memory uploaded files."""
+    def make(name="test.pdf", content=FILE_CONTENT):
+        return SimpleUploadedFile(name, content)
+    return make
+
+
 class TestAzureBlobStorageInit:
     """Tests for storage initialization."""
     
@@ -54,14 +92,6 @@ class TestAzureBlobStorageInit:
             'attachments.storage.BlobServiceClient.from_connection_string',
             return_value=mock_blob_service
         )
-        mocker.patch(
-            'attachments.storage.settings.AZURE_STORAGE_CONNECTION_STRING',
-            'test-connection-string'
-        )
-        mocker.patch(
-            'attachments.storage.settings.AZURE_STORAGE_CONTAINER_NAME',
-            'test-container'
-        )
         
         storage = AzureBlobStorage()
         
@@ -71,12 +101,11 @@ class TestAzureBlobStorageInit:
 class TestSaveFile:
     """Tests for saving files to Azure Blob Storage."""
     
-    def test_save_file_success(self, storage, mock_blob_service):
+    def test_save_file_success(self, storage, blob_client, uploaded_file_factory):
         """Test successful file upload."""
-        file = SimpleUploadedFile("test.pdf", b"file content")
+        file = uploaded_file_factory()
         blob_name = "test-blob.pdf"
         
-        blob_client = mock_blob_service.get_blob_client.return_value
         blob_client.upload_blob.return_value = None
         
         result = storage.save(blob_name, file)
@@ -84,13 +113,11 @@ class TestSaveFile:
         assert result == blob_name
         blob_client.upload_blob.assert_called_once()
     
-    def test_save_file_overwrites_existing(self, storage, mock_blob_service):
+    def test_save_file_overwrites_existing(self, storage, blob_client, uploaded_file_factory):
         """Test that save overwrites existing blobs."""
-        file = SimpleUploadedFile("test.pdf", b"new content")
+        file = uploaded_file_factory(content=NEW_FILE_CONTENT)
         blob_name = "existing-blob.pdf"
         
-        blob_client = mock_blob_service.get_blob_client.return_value
-        
         storage.save(blob_name, file)
         
         # Should call upload with overwrite=True
@@ -101,75 +128,52 @@ class TestSaveFile:
 class TestDeleteFile:
     """Tests for deleting files from Azure Blob Storage."""
     
-    def test_delete_existing_file(self, storage, mock_blob_service):
-        """Test deletion of existing blob."""
+    @pytest.mark.parametrize("blob_exists", [True, False])
+    def test_delete_file(self, storage, blob_client, blob_exists):
+        """Test delete() removes existing blobs and returns whether it did."""
         blob_name = "test-blob.pdf"
         
-        blob_client = mock_blob_service.get_blob_client.return_value
-        blob_client.exists.return_value = True
+        blob_client.exists.return_value = blob_exists
         
         result = storage.delete(blob_name)
         
-        assert result is True
-        blob_client.delete_blob.assert_called_once()
-    
-    def test_delete_non_existing_file(self, storage, mock_blob_service):
-        """Test deletion of non-existing blob returns False."""
-        blob_name = "non-existing.pdf"
-        
-        blob_client = mock_blob_service.get_blob_client.return_value
-        blob_client.exists.return_value = False
-        
-        result = storage.delete(blob_name)
-        
-        assert result is False
-        blob_client.delete_blob.assert_not_called()
+        assert result is blob_exists
+        assert blob_client.delete_blob.call_count == int(blob_exists)
 
 
 class TestFileExists:
     """Tests for checking file existence."""
     
-    def test_exists_returns_true_for_existing_file(self, storage, mock_blob_service):
-        """Test exists() returns True for existing blob."""
-        blob_name = "existing-blob.pdf"
-        
-        blob_client = mock_blob_service.get_blob_client.return_value
-        blob_client.exists.return_value = True
-        
-        result = storage.exists(blob_name)
-        
-        assert result is True
-    
-    def test_exists_returns_false_for_missing_file(self, storage, mock_blob_service):
-        """Test exists() returns False for missing blob."""
-        blob_name = "missing-blob.pdf"
+    @pytest.mark.parametrize("expected", [True, False])
+    def test_exists(self, storage, blob_client, expected):
+        """Test exists() reports whether the blob exists."""
+        blob_name = "test-blob.pdf"
         
-        blob_client = mock_blob_service.get_blob_client.return_value
-        blob_client.exists.return_value = False
+        blob_client.exists.return_value = expected
         
         result = storage.exists(blob_name)
         
-        assert result is False
+        assert result is expected
 
 
 class TestGetSignedUrl:
     """Tests for generating signed URLs."""
     
-    def test_get_signed_url_generates_valid_url(self, storage, mock_blob_service, mocker):
-        """Test that signed URL is generated correctly."""
-        blob_name = "test-blob.pdf"
-        
-        blob_client = mock_blob_service.get_blob_client.return_value
-        blob_client.url = "https://account.blob.core.windows.net/container/test-blob.pdf"
-        
-        # Mock generate_blob_sas function
-        mocker.patch(
+    @pytest.fixture
+    def generate_sas(self, storage, mocker):
+        """Give storage SAS credentials and mock generate_blob_sas."""
+        # Mock connection string parsing
+        storage.connection_string = 'AccountName=testaccount;AccountKey=testkey123=='
+        return mocker.patch(
             'attachments.storage.generate_blob_sas',
             return_value='sas_token_123'
         )
+    
+    def test_get_signed_url_generates_valid_url(self, storage, blob_client, generate_sas):
+        """Test that signed URL is generated correctly."""
+        blob_name = "test-blob.pdf"
         
-        # Mock connection string parsing
-        storage.connection_string = 'AccountName=testaccount;AccountKey=testkey123=='
+        blob_client.url = "https://account.blob.core.windows.net/container/test-blob.pdf"
         
         url = storage.get_signed_url(blob_name, expiry_hours=1)
         
@@ -177,37 +181,26 @@ class TestGetSignedUrl:
         assert blob_name in url
         assert "sas_token_123" in url
     
-    def test_get_signed_url_custom_expiry(self, storage, mock_blob_service, mocker):
+    def test_get_signed_url_custom_expiry(self, storage, blob_client, generate_sas):
         """Test that custom expiry time is applied."""
         blob_name = "test-blob.pdf"
         
-        blob_client = mock_blob_service.get_blob_client.return_value
         blob_client.url = "https://account.blob.core.windows.net/container/test-blob.pdf"
         
-        # Mock generate_blob_sas function
-        mock_generate_sas = mocker.patch(
-            'attachments.storage.generate_blob_sas',
-            return_value='sas_token_123'
-        )
-        
-        # Mock connection string parsing
-        storage.connection_string = 'AccountName=testaccount;AccountKey=testkey123=='
-        
         storage.get_signed_url(blob_name, expiry_hours=24)
         
         # Verify SAS token generation was called
-        assert mock_generate_sas.called
+        assert generate_sas.called
 
 
 class TestGetFileSize:
     """Tests for getting file size."""
     
-    def test_get_size_returns_correct_value(self, storage, mock_blob_service):
+    def test_get_size_returns_correct_value(self, storage, blob_client):
         """Test that size() returns correct file size."""
         blob_name = "test-blob.pdf"
         expected_size = 1024
         
-        blob_client = mock_blob_service.get_blob_client.return_value
         props = MagicMock()
         props.size = expected_size
         blob_client.get_blob_properties.return_value = props
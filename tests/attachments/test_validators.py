@@ -1,9 +1,13 @@
 """
 Tests for file validators in attachments app.
 """
+from types import SimpleNamespace
+
 import pytest
 from django.core.exceptions import ValidationError
 from attachments.validators import (
+    ALLOWED_EXTENSIONS,
+    ALLOWED_MIME_TYPES,
     validate_file_size,
     validate_file_extension,
     validate_mime_type,
@@ -13,51 +17,36 @@ from attachments.validators import (
 class TestFileSizeValidator:
     """Tests for file size validation."""
     
-    def test_valid_file_size(self):
-        """Test that files under 10MB pass validation."""
-        # Mock file with 5MB size
-        class MockFile:
-            size = 5 * 1024 * 1024  # 5MB
-        
-        file = MockFile()
-        # Should not raise exception
-        validate_file_size(file)
-    
-    def test_file_size_exactly_10mb(self):
-        """Test that exactly 10MB file passes validation."""
-        class MockFile:
-            size = 10 * 1024 * 1024  # 10MB
-        
-        file = MockFile()
+    @pytest.mark.parametrize("size", [
+        5 * 1024 * 1024,  # 5MB
+        10 * 1024 * 1024,  # Exactly 10MB
+    ])
+    def test_valid_file_sizes(self, size):
+        """Test that files up to 10MB pass validation."""
+        file = SimpleNamespace(size=size)
         # Should not raise exception
         validate_file_size(file)
     
-    def test_file_size_exceeds_limit(self):
-        """Test that files over 10MB fail validation."""
-        class MockFile:
-            size = 11 * 1024 * 1024  # 11MB
-        
-        file = MockFile()
-        with pytest.raises(ValidationError) as exc_info:
-            validate_file_size(file)
-        
-        assert "File size exceeds 10MB limit" in str(exc_info.value)
-    
-    def test_empty_file(self):
-        """Test that empty files fail validation."""
-        class MockFile:
-            size = 0
-        
-        file = MockFile()
+    @pytest.mark.parametrize("size,message", [
+        (11 * 1024 * 1024, "File size exceeds 10MB limit"),
+        (0, "File is empty"),
+    ])
+    def test_invalid_file_sizes(self, size, message):
+        """Test that empty files and files over 10MB fail validation."""
+        file = SimpleNamespace(size=size)
         with pytest.raises(ValidationError) as exc_info:
             validate_file_size(file)
         
-        assert "File is empty" in str(exc_info.value)
+        assert message in str(exc_info.value)
 
 
 class TestFileExtensionValidator:
     """Tests for file extension validation."""
     
+    def test_allowed_extensions_is_frozenset(self):
+        """Test that the extension whitelist supports O(1) membership checks."""
+        assert isinstance(ALLOWED_EXTENSIONS, frozenset)
+    
     @pytest.mark.parametrize("filename", [
         "document.pdf",
         "image.jpg",
@@ -74,10 +63,7 @@ class TestFileExtensionValidator:
     ])
     def test_valid_extensions(self, filename):
         """Test that allowed file extensions pass validation."""
-        class MockFile:
-            name = filename
-        
-        file = MockFile()
+        file = SimpleNamespace(name=filename)
         # Should not raise exception
         validate_file_extension(file)
     
@@ -92,10 +78,7 @@ class TestFileExtensionValidator:
     ])
     def test_invalid_extensions(self, filename):
         """Test that disallowed file extensions fail validation."""
-        class MockFile:
-            name = filename
-        
-        file = MockFile()
+        file = SimpleNamespace(name=filename)
         with pytest.raises(ValidationError) as exc_info:
             validate_file_extension(file)
         
@@ -104,19 +87,13 @@ class TestFileExtensionValidator:
     
     def test_case_insensitive_validation(self):
         """Test that extension validation is case-insensitive."""
-        class MockFile:
-            name = "DOCUMENT.PDF"
-        
-        file = MockFile()
+        file = SimpleNamespace(name="DOCUMENT.PDF")
         # Should not raise exception
         validate_file_extension(file)
     
     def test_no_extension(self):
         """Test that files without extension fail validation."""
-        class MockFile:
-            name = "filename_without_extension"
-        
-        file = MockFile()
+        file = SimpleNamespace(name="filename_without_extension")
         with pytest.raises(ValidationError) as exc_info:
             validate_file_extension(file)
         
@@ -126,6 +103,17 @@ class TestFileExtensionValidator:
 class TestMimeTypeValidator:
     """Tests for MIME type validation."""
     
+    @pytest.fixture
+    def detected_kind(self, monkeypatch):
+        """Stub filetype.guess; tests set ``mime`` on the returned kind."""
+        kind = SimpleNamespace(mime=None)
+        monkeypatch.setattr('filetype.guess', lambda content: kind)
+        return kind
+    
+    def test_allowed_mime_types_is_frozenset(self):
+        """Test that the MIME type whitelist supports O(1) membership checks."""
+        assert isinstance(ALLOWED_MIME_TYPES, frozenset)
+    
     @pytest.mark.parametrize("mime_type,extension", [
         ("application/pdf", "pdf"),
         ("image/jpeg", "jpg"),
@@ -135,7 +123,7 @@ class TestMimeTypeValidator:
         ("text/csv", "csv"),
         ("application/zip", "zip"),
     ])
-    def test_valid_mime_types(self, mime_type, extension, mocker):
+    def test_valid_mime_types(self, mime_type, extension, detected_kind):
         """Test that allowed MIME types pass validation."""
         class MockFile:
             name = f"test.{extension}"
@@ -147,12 +135,7 @@ class TestMimeTypeValidator:
                 pass
         
         file = MockFile()
-        
-        # Mock filetype.guess to return a mock file type
-        class MockKind:
-            mime = mime_type
-        
-        mocker.patch('filetype.guess', return_value=MockKind())
+        detected_kind.mime = mime_type
         
         # Should not raise exception
         validate_mime_type(file)
@@ -164,7 +147,7 @@ class TestMimeTypeValidator:
         "application/javascript",
         "application/x-python-code",
     ])
-    def test_invalid_mime_types(self, mime_type, mocker):
+    def test_invalid_mime_types(self, mime_type, detected_kind):
         """Test that disallowed MIME types fail validation."""
         class MockFile:
             name = "test.exe"
@@ -176,12 +159,7 @@ class TestMimeTypeValidator:
                 pass
         
         file = MockFile()
-        
-        # Mock filetype.guess to return a mock file type
-        class MockKind:
-            mime = mime_type
-        
-        mocker.patch('filetype.guess', return_value=MockKind())
+        detected_kind.mime = mime_type
         
         with pytest.raises(ValidationError) as exc_info:
             validate_mime_type(file)
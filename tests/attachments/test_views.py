@@ -3,87 +3,129 @@ Tests for attachment views.
 """
 import pytest
 from django.urls import reverse
+from django.contrib.messages import get_messages
 from django.core.files.uploadedfile import SimpleUploadedFile
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from attachments.models import Attachment
-from tasks.models import Task
+from attachments.storage import AzureBlobStorage
 from tests.tasks.factories import TaskFactory, UserFactory
 
 
+PDF_BYTES = b'%PDF-1.4 valid pdf content here'
+
+
+def make_pdf(name="document.pdf", content=PDF_BYTES):
+    """Build a fresh PDF upload around the shared ``PDF_BYTES`` payload."""
+    return SimpleUploadedFile(name, content, content_type="application/pdf")
+
+
+def _attachment_url(name, pk):
+    """Reverse an attachment URL; upload and list take the task's pk."""
+    kwarg = "task_pk" if name in ("upload", "list") else "pk"
+    return reverse(f"attachments:{name}", kwargs={kwarg: pk})
+
+
+@pytest.fixture
+def mock_azure(mocker):
+    """Patch AzureBlobStorage in views and signals with one shared mock."""
+    mock_storage = Mock(spec=AzureBlobStorage)
+    mock_storage.exists.return_value = True
+    mocker.patch('attachments.views.AzureBlobStorage', return_value=mock_storage)
+    mocker.patch('attachments.signals.AzureBlobStorage', return_value=mock_storage)
+    return mock_storage
+
+
+@pytest.fixture
+def task_with_attachment(db):
+    """Create a task with one attachment, owned by a user who is not logged in."""
+    task = TaskFactory(owner=UserFactory())
+    attachment = Attachment.objects.create(
+        task=task,
+        file_name="file.pdf",
+        blob_name="blob.pdf",
+        file_size=1024,
+        content_type="application/pdf"
+    )
+    return task, attachment
+
+
+@pytest.fixture(scope="class")
+def shared_task(auth_user, committed):
+    """Task owned by ``auth_user``, created once per class for read-only tests."""
+    with committed(TaskFactory, owner=auth_user) as task:
+        yield task
+
+
 @pytest.mark.django_db
-class TestAttachmentUploadView:
-    """Test cases for AttachmentUploadView."""
+@pytest.mark.xdist_group(name='attachment_auth_views')
+class TestAttachmentViewsRequireAuthentication:
+    """Test that every attachment view redirects anonymous users to login."""
     
-    def test_upload_requires_authentication(self, client):
-        """Test that upload view requires login."""
-        user = UserFactory()
-        task = TaskFactory(owner=user)
-        
-        url = reverse("attachments:upload", kwargs={'task_pk': task.pk})
+    @pytest.mark.parametrize("view_name,pk_kwarg", [
+        ("upload", "task_pk"),
+        ("list", "task_pk"),
+        ("download", "pk"),
+        ("delete", "pk"),
+    ])
+    def test_requires_authentication(self, client, task_with_attachment, view_name, pk_kwarg):
+        """Test that the view requires login."""
+        task, attachment = task_with_attachment
+        pk = task.pk if pk_kwarg == "task_pk" else attachment.pk
+        
+        url = _attachment_url(view_name, pk)
         response = client.get(url)
         
         assert response.status_code == 302  # Redirect to login
         assert "/accounts/login/" in response.url
+
+
+@pytest.mark.django_db(transaction=False)
+@pytest.mark.xdist_group(name='attachment_upload_views')
+class TestAttachmentUploadView:
+    """Test cases for AttachmentUploadView."""
     
-    def test_upload_valid_file(self, client):
+    def test_upload_valid_file(self, logged_client, auth_user, mock_azure):
         """Test uploading a valid file."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:upload", kwargs={'task_pk': task.pk})
+        url = _attachment_url("upload", task.pk)
         
-        file_content = b'%PDF-1.4 valid pdf content here'
-        file = SimpleUploadedFile(
-            "document.pdf",
-            file_content,
-            content_type="application/pdf"
-        )
+        file = make_pdf()
         
-        with patch('attachments.views.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.generate_blob_name.return_value = f"{task.id}/20260120_abc123_document.pdf"
-            mock_storage._save.return_value = f"{task.id}/20260120_abc123_document.pdf"
-            
-            response = client.post(url, {'file': file}, follow=True)
+        mock_azure.generate_blob_name.return_value = f"{task.id}/20260120_abc123_document.pdf"
         
-        assert response.status_code == 200
+        response = logged_client.post(url, {'file': file})
+        
+        assert response.status_code == 302
         assert Attachment.objects.filter(task=task).count() == 1
         
         attachment = Attachment.objects.get(task=task)
         assert attachment.file_name == "document.pdf"
-        assert attachment.file_size == len(file_content)
+        assert attachment.file_size == len(PDF_BYTES)
     
-    def test_upload_file_too_large(self, client):
-        """Test uploading a file larger than 10MB."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+    def test_upload_file_too_large(self, logged_client, shared_task, monkeypatch):
+        """Test uploading a file over the size limit, lowered to 1KB for speed."""
+        task = shared_task
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:upload", kwargs={'task_pk': task.pk})
+        url = _attachment_url("upload", task.pk)
         
-        # Create file larger than 10MB
-        large_content = b'x' * (10 * 1024 * 1024 + 1)
-        file = SimpleUploadedFile(
-            "large.pdf",
-            large_content,
-            content_type="application/pdf"
-        )
+        # The test client re-encodes the upload, so the size can't be faked;
+        # lower the limit instead of building and posting a 10MB body
+        monkeypatch.setattr('attachments.validators.MAX_FILE_SIZE', 1024)
+        file = make_pdf("large.pdf", b'x' * 1025)
         
-        response = client.post(url, {'file': file})
+        response = logged_client.post(url, {'file': file})
         
         assert response.status_code == 200  # Re-render form with errors
         assert not Attachment.objects.filter(task=task).exists()
-        assert b'exceeds 10MB limit' in response.content or 'exceeds 10MB limit' in str(response.context.get('form', {}).errors)
+        errors = response.context['form'].errors['file']
+        assert any('exceeds' in error for error in errors)
     
-    def test_upload_invalid_file_type(self, client):
+    def test_upload_invalid_file_type(self, logged_client, shared_task):
         """Test uploading an invalid file type (.exe)."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = shared_task
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:upload", kwargs={'task_pk': task.pk})
+        url = _attachment_url("upload", task.pk)
         
         file_content = b'MZ executable content'
         file = SimpleUploadedFile(
@@ -92,196 +134,136 @@ class TestAttachmentUploadView:
             content_type="application/x-msdownload"
         )
         
-        response = client.post(url, {'file': file})
+        response = logged_client.post(url, {'file': file})
         
         assert response.status_code == 200  # Re-render form
         assert not Attachment.objects.filter(task=task).exists()
     
-    def test_upload_exceeds_limit(self, client):
+    def test_upload_exceeds_limit(self, logged_client, auth_user):
         """Test uploading 6th file when limit is 5."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         
         # Create 5 existing attachments
-        for i in range(5):
-            Attachment.objects.create(
+        Attachment.objects.bulk_create([
+            Attachment(
                 task=task,
                 file_name=f"file{i}.pdf",
                 blob_name=f"blob{i}.pdf",
                 file_size=1024,
                 content_type="application/pdf"
             )
+            for i in range(5)
+        ])
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:upload", kwargs={'task_pk': task.pk})
+        url = _attachment_url("upload", task.pk)
         
-        file = SimpleUploadedFile(
-            "sixth.pdf",
-            b'content',
-            content_type="application/pdf"
-        )
+        file = make_pdf("sixth.pdf")
         
-        response = client.post(url, {'file': file})
+        response = logged_client.post(url, {'file': file})
         
         assert response.status_code == 200  # Re-render form
         assert Attachment.objects.filter(task=task).count() == 5  # Still 5
     
-    def test_upload_to_other_user_task(self, client):
+    def test_upload_to_other_user_task(self, logged_client):
         """Test uploading to another user's task is forbidden."""
-        user1 = UserFactory(password="testpass123")
         user2 = UserFactory()
         task = TaskFactory(owner=user2)
         
-        client.login(username=user1.email, password="testpass123")
-        url = reverse("attachments:upload", kwargs={'task_pk': task.pk})
+        url = _attachment_url("upload", task.pk)
         
-        file = SimpleUploadedFile(
-            "file.pdf",
-            b'content',
-            content_type="application/pdf"
-        )
+        file = make_pdf("file.pdf")
         
-        response = client.post(url, {'file': file})
+        response = logged_client.post(url, {'file': file})
         
         assert response.status_code == 403  # Forbidden
         assert not Attachment.objects.filter(task=task).exists()
     
-    def test_upload_empty_file(self, client):
+    def test_upload_empty_file(self, logged_client, shared_task):
         """Test uploading an empty file (0 bytes)."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = shared_task
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:upload", kwargs={'task_pk': task.pk})
+        url = _attachment_url("upload", task.pk)
         
-        file = SimpleUploadedFile(
-            "empty.pdf",
-            b'',
-            content_type="application/pdf"
-        )
+        file = make_pdf("empty.pdf", b'')
         
-        response = client.post(url, {'file': file})
+        response = logged_client.post(url, {'file': file})
         
         assert response.status_code == 200  # Re-render form
         assert not Attachment.objects.filter(task=task).exists()
     
-    def test_upload_generates_unique_blob_name(self, client):
+    def test_upload_generates_unique_blob_name(self, logged_client, auth_user, mock_azure):
         """Test that upload generates unique blob names."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:upload", kwargs={'task_pk': task.pk})
+        url = _attachment_url("upload", task.pk)
         
-        file1 = SimpleUploadedFile(
-            "document.pdf",
-            b'%PDF-1.4 content1',
-            content_type="application/pdf"
-        )
+        mock_azure.generate_blob_name.side_effect = [
+            f"{task.id}/20260120_abc123_document.pdf",
+            f"{task.id}/20260120_def456_document.pdf",
+        ]
         
-        with patch('attachments.views.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.generate_blob_name.return_value = f"{task.id}/20260120_abc123_document.pdf"
-            mock_storage._save.return_value = f"{task.id}/20260120_abc123_document.pdf"
-            
-            client.post(url, {'file': file1}, follow=True)
-        
-        file2 = SimpleUploadedFile(
-            "document.pdf",
-            b'%PDF-1.4 content2',
-            content_type="application/pdf"
-        )
-        
-        with patch('attachments.views.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.generate_blob_name.return_value = f"{task.id}/20260120_def456_document.pdf"
-            mock_storage._save.return_value = f"{task.id}/20260120_def456_document.pdf"
-            
-            client.post(url, {'file': file2}, follow=True)
+        logged_client.post(url, {'file': make_pdf()})
+        logged_client.post(url, {'file': make_pdf()})
         
         attachments = Attachment.objects.filter(task=task)
         assert attachments.count() == 2
         assert attachments[0].blob_name != attachments[1].blob_name
     
-    def test_upload_stores_metadata(self, client):
+    def test_upload_stores_metadata(self, logged_client, auth_user, mock_azure):
         """Test that upload stores correct file metadata."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:upload", kwargs={'task_pk': task.pk})
+        url = _attachment_url("upload", task.pk)
         
-        file_content = b'%PDF-1.4 sample pdf'
-        file = SimpleUploadedFile(
-            "report.pdf",
-            file_content,
-            content_type="application/pdf"
-        )
+        file = make_pdf("report.pdf")
+        
+        mock_azure.generate_blob_name.return_value = f"{task.id}/20260120_xyz789_report.pdf"
         
-        with patch('attachments.views.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.generate_blob_name.return_value = f"{task.id}/20260120_xyz789_report.pdf"
-            mock_storage._save.return_value = f"{task.id}/20260120_xyz789_report.pdf"
-            
-            response = client.post(url, {'file': file}, follow=True)
+        logged_client.post(url, {'file': file})
         
         attachment = Attachment.objects.get(task=task)
         assert attachment.file_name == "report.pdf"
-        assert attachment.file_size == len(file_content)
+        assert attachment.file_size == len(PDF_BYTES)
         assert attachment.content_type == "application/pdf"
         assert attachment.blob_name == f"{task.id}/20260120_xyz789_report.pdf"
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
+@pytest.mark.xdist_group(name='attachment_list_views')
 class TestAttachmentListView:
     """Test cases for AttachmentListView."""
     
-    def test_list_requires_authentication(self, client):
-        """Test that list view requires login."""
-        user = UserFactory()
-        task = TaskFactory(owner=user)
-        
-        url = reverse("attachments:list", kwargs={'task_pk': task.pk})
-        response = client.get(url)
-        
-        assert response.status_code == 302  # Redirect to login
-        assert "/accounts/login/" in response.url
-    
-    def test_list_shows_user_task_attachments(self, client):
+    def test_list_shows_user_task_attachments(self, logged_client, auth_user):
         """Test that list shows attachments for user's task."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         
         # Create attachments
-        attachment1 = Attachment.objects.create(
-            task=task,
-            file_name="file1.pdf",
-            blob_name="blob1.pdf",
-            file_size=1024,
-            content_type="application/pdf"
-        )
-        attachment2 = Attachment.objects.create(
-            task=task,
-            file_name="file2.jpg",
-            blob_name="blob2.jpg",
-            file_size=2048,
-            content_type="image/jpeg"
-        )
+        attachment1, attachment2 = Attachment.objects.bulk_create([
+            Attachment(
+                task=task,
+                file_name="file1.pdf",
+                blob_name="blob1.pdf",
+                file_size=1024,
+                content_type="application/pdf"
+            ),
+            Attachment(
+                task=task,
+                file_name="file2.jpg",
+                blob_name="blob2.jpg",
+                file_size=2048,
+                content_type="image/jpeg"
+            ),
+        ])
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:list", kwargs={'task_pk': task.pk})
-        response = client.get(url)
+        url = _attachment_url("list", task.pk)
+        response = logged_client.get(url)
         
         assert response.status_code == 200
         assert attachment1 in response.context['attachments']
         assert attachment2 in response.context['attachments']
     
-    def test_list_hides_other_user_attachments(self, client):
+    def test_list_hides_other_user_attachments(self, logged_client):
         """Test that list doesn't show other users' attachments."""
-        user1 = UserFactory(password="testpass123")
         user2 = UserFactory()
         task = TaskFactory(owner=user2)
         
@@ -294,30 +276,26 @@ class TestAttachmentListView:
             content_type="application/pdf"
         )
         
-        client.login(username=user1.email, password="testpass123")
-        url = reverse("attachments:list", kwargs={'task_pk': task.pk})
-        response = client.get(url)
+        url = _attachment_url("list", task.pk)
+        response = logged_client.get(url)
         
         assert response.status_code == 200
         assert len(response.context['attachments']) == 0
     
-    def test_list_shows_empty_state(self, client):
+    def test_list_shows_empty_state(self, logged_client, shared_task):
         """Test that list shows appropriate message when no attachments."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = shared_task
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:list", kwargs={'task_pk': task.pk})
-        response = client.get(url)
+        url = _attachment_url("list", task.pk)
+        response = logged_client.get(url)
         
         assert response.status_code == 200
         assert len(response.context['attachments']) == 0
         assert b'No attachments' in response.content
     
-    def test_list_displays_metadata(self, client):
+    def test_list_displays_metadata(self, logged_client, auth_user):
         """Test that list displays file metadata correctly."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         
         attachment = Attachment.objects.create(
             task=task,
@@ -327,42 +305,22 @@ class TestAttachmentListView:
             content_type="application/pdf"
         )
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:list", kwargs={'task_pk': task.pk})
-        response = client.get(url)
+        url = _attachment_url("list", task.pk)
+        response = logged_client.get(url)
         
         assert response.status_code == 200
-        content = response.content.decode()
-        assert "document.pdf" in content
-        assert "application/pdf" in content
+        assert b"document.pdf" in response.content
+        assert b"application/pdf" in response.content
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
+@pytest.mark.xdist_group(name='attachment_download_views')
 class TestAttachmentDownloadView:
     """Test cases for AttachmentDownloadView."""
     
-    def test_download_requires_authentication(self, client):
-        """Test that download view requires login."""
-        user = UserFactory()
-        task = TaskFactory(owner=user)
-        attachment = Attachment.objects.create(
-            task=task,
-            file_name="file.pdf",
-            blob_name="blob.pdf",
-            file_size=1024,
-            content_type="application/pdf"
-        )
-        
-        url = reverse("attachments:download", kwargs={'pk': attachment.pk})
-        response = client.get(url)
-        
-        assert response.status_code == 302  # Redirect to login
-        assert "/accounts/login/" in response.url
-    
-    def test_download_valid_attachment(self, client):
+    def test_download_valid_attachment(self, logged_client, auth_user, mock_azure):
         """Test downloading a valid attachment."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         attachment = Attachment.objects.create(
             task=task,
             file_name="document.pdf",
@@ -371,23 +329,17 @@ class TestAttachmentDownloadView:
             content_type="application/pdf"
         )
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:download", kwargs={'pk': attachment.pk})
+        url = _attachment_url("download", attachment.pk)
+        
+        mock_azure.get_signed_url.return_value = "https://storage.example.com/download?sig=abc123"
         
-        with patch('attachments.views.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.exists.return_value = True
-            mock_storage.get_signed_url.return_value = "https://storage.example.com/download?sig=abc123"
-            
-            response = client.get(url)
+        response = logged_client.get(url)
         
         assert response.status_code == 302  # Redirect to signed URL
         assert response.url == "https://storage.example.com/download?sig=abc123"
     
-    def test_download_other_user_attachment(self, client):
+    def test_download_other_user_attachment(self, logged_client):
         """Test downloading another user's attachment returns 403."""
-        user1 = UserFactory(password="testpass123")
         user2 = UserFactory()
         task = TaskFactory(owner=user2)
         attachment = Attachment.objects.create(
@@ -398,26 +350,21 @@ class TestAttachmentDownloadView:
             content_type="application/pdf"
         )
         
-        client.login(username=user1.email, password="testpass123")
-        url = reverse("attachments:download", kwargs={'pk': attachment.pk})
-        response = client.get(url)
+        url = _attachment_url("download", attachment.pk)
+        response = logged_client.get(url)
         
         assert response.status_code == 403  # Forbidden
     
-    def test_download_nonexistent_attachment(self, client):
+    def test_download_nonexistent_attachment(self, logged_client):
         """Test downloading nonexistent attachment returns 404."""
-        user = UserFactory(password="testpass123")
-        
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:download", kwargs={'pk': 99999})
-        response = client.get(url)
+        url = _attachment_url("download", 99999)
+        response = logged_client.get(url)
         
         assert response.status_code == 404
     
-    def test_download_missing_blob(self, client):
+    def test_download_missing_blob(self, logged_client, auth_user, mock_azure):
         """Test downloading when blob is missing from storage."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         attachment = Attachment.objects.create(
             task=task,
             file_name="missing.pdf",
@@ -426,24 +373,19 @@ class TestAttachmentDownloadView:
             content_type="application/pdf"
         )
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:download", kwargs={'pk': attachment.pk})
+        url = _attachment_url("download", attachment.pk)
         
-        with patch('attachments.views.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.exists.return_value = False
-            
-            response = client.get(url, follow=True)
+        mock_azure.exists.return_value = False
         
-        assert response.status_code == 200
-        messages = list(response.context['messages'])
+        response = logged_client.get(url)
+        
+        assert response.status_code == 302
+        messages = list(get_messages(response.wsgi_request))
         assert any('not found' in str(msg).lower() for msg in messages)
     
-    def test_download_correct_content_type(self, client):
+    def test_download_correct_content_type(self, logged_client, auth_user, mock_azure):
         """Test that download provides correct content type."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         attachment = Attachment.objects.create(
             task=task,
             file_name="image.jpg",
@@ -452,24 +394,20 @@ class TestAttachmentDownloadView:
             content_type="image/jpeg"
         )
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:download", kwargs={'pk': attachment.pk})
+        url = _attachment_url("download", attachment.pk)
+        
+        mock_azure.get_signed_url.return_value = "https://storage.example.com/download"
         
-        with patch('attachments.views.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.exists.return_value = True
-            mock_storage.url.return_value = "https://storage.example.com/download"
-            
-            response = client.get(url)
+        response = logged_client.get(url)
         
         # Verify storage methods were called correctly
-        mock_storage.exists.assert_called_once_with("image_blob.jpg")
+        assert response.status_code == 302
+        mock_azure.exists.assert_called_once_with("image_blob.jpg")
+        mock_azure.get_signed_url.assert_called_once_with("image_blob.jpg")
     
-    def test_download_correct_filename(self, client):
+    def test_download_correct_filename(self, logged_client, auth_user, mock_azure):
         """Test that download provides correct filename."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         attachment = Attachment.objects.create(
             task=task,
             file_name="report.xlsx",
@@ -478,46 +416,25 @@ class TestAttachmentDownloadView:
             content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         )
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:download", kwargs={'pk': attachment.pk})
+        url = _attachment_url("download", attachment.pk)
         
-        with patch('attachments.views.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.exists.return_value = True
-            mock_storage.url.return_value = "https://storage.example.com/download"
-            
-            response = client.get(url)
+        mock_azure.get_signed_url.return_value = "https://storage.example.com/download"
+        
+        response = logged_client.get(url)
         
         assert response.status_code == 302
+        assert response.url == "https://storage.example.com/download"
+        mock_azure.get_signed_url.assert_called_once_with("report_blob.xlsx")
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
+@pytest.mark.xdist_group(name='attachment_delete_views')
 class TestAttachmentDeleteView:
     """Test cases for AttachmentDeleteView."""
     
-    def test_delete_requires_authentication(self, client):
-        """Test that delete view requires login."""
-        user = UserFactory()
-        task = TaskFactory(owner=user)
-        attachment = Attachment.objects.create(
-            task=task,
-            file_name="file.pdf",
-            blob_name="blob.pdf",
-            file_size=1024,
-            content_type="application/pdf"
-        )
-        
-        url = reverse("attachments:delete", kwargs={'pk': attachment.pk})
-        response = client.get(url)
-        
-        assert response.status_code == 302  # Redirect to login
-        assert "/accounts/login/" in response.url
-    
-    def test_delete_requires_confirmation(self, client):
+    def test_delete_requires_confirmation(self, logged_client, auth_user):
         """Test that GET shows confirmation page."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         attachment = Attachment.objects.create(
             task=task,
             file_name="file.pdf",
@@ -526,17 +443,15 @@ class TestAttachmentDeleteView:
             content_type="application/pdf"
         )
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:delete", kwargs={'pk': attachment.pk})
-        response = client.get(url)
+        url = _attachment_url("delete", attachment.pk)
+        response = logged_client.get(url)
         
         assert response.status_code == 200
-        assert b'Confirm Deletion' in response.content or b'confirm' in response.content.lower()
+        assert b'Confirm Deletion' in response.content
     
-    def test_delete_valid_attachment(self, client):
+    def test_delete_valid_attachment(self, logged_client, auth_user, mock_azure):
         """Test deleting a valid attachment."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         attachment = Attachment.objects.create(
             task=task,
             file_name="document.pdf",
@@ -547,23 +462,16 @@ class TestAttachmentDeleteView:
         
         attachment_id = attachment.id
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:delete", kwargs={'pk': attachment.pk})
+        url = _attachment_url("delete", attachment.pk)
         
-        with patch('attachments.signals.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.exists.return_value = True
-            
-            response = client.post(url, follow=True)
+        response = logged_client.post(url)
         
-        assert response.status_code == 200
+        assert response.status_code == 302
         assert not Attachment.objects.filter(id=attachment_id).exists()
-        mock_storage.delete.assert_called_once_with("test_blob.pdf")
+        mock_azure.delete.assert_called_once_with("test_blob.pdf")
     
-    def test_delete_other_user_attachment(self, client):
+    def test_delete_other_user_attachment(self, logged_client):
         """Test deleting another user's attachment returns 403."""
-        user1 = UserFactory(password="testpass123")
         user2 = UserFactory()
         task = TaskFactory(owner=user2)
         attachment = Attachment.objects.create(
@@ -574,17 +482,15 @@ class TestAttachmentDeleteView:
             content_type="application/pdf"
         )
         
-        client.login(username=user1.email, password="testpass123")
-        url = reverse("attachments:delete", kwargs={'pk': attachment.pk})
-        response = client.post(url)
+        url = _attachment_url("delete", attachment.pk)
+        response = logged_client.post(url)
         
         assert response.status_code == 403  # Forbidden
         assert Attachment.objects.filter(id=attachment.id).exists()
     
-    def test_delete_removes_blob_from_storage(self, client):
+    def test_delete_removes_blob_from_storage(self, logged_client, auth_user, mock_azure):
         """Test that delete removes blob from Azure storage."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         attachment = Attachment.objects.create(
             task=task,
             file_name="file.pdf",
@@ -593,23 +499,16 @@ class TestAttachmentDeleteView:
             content_type="application/pdf"
         )
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:delete", kwargs={'pk': attachment.pk})
+        url = _attachment_url("delete", attachment.pk)
         
-        with patch('attachments.signals.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.exists.return_value = True
-            
-            response = client.post(url, follow=True)
+        logged_client.post(url)
         
-        mock_storage.exists.assert_called_once_with("unique_blob.pdf")
-        mock_storage.delete.assert_called_once_with("unique_blob.pdf")
+        mock_azure.exists.assert_called_once_with("unique_blob.pdf")
+        mock_azure.delete.assert_called_once_with("unique_blob.pdf")
     
-    def test_delete_removes_attachment_record(self, client):
+    def test_delete_removes_attachment_record(self, logged_client, auth_user, mock_azure):
         """Test that delete removes attachment record from database."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         attachment = Attachment.objects.create(
             task=task,
             file_name="file.pdf",
@@ -620,22 +519,15 @@ class TestAttachmentDeleteView:
         
         attachment_id = attachment.id
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:delete", kwargs={'pk': attachment.pk})
+        url = _attachment_url("delete", attachment.pk)
         
-        with patch('attachments.views.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.exists.return_value = True
-            
-            client.post(url)
+        logged_client.post(url)
         
         assert not Attachment.objects.filter(id=attachment_id).exists()
     
-    def test_delete_with_missing_blob(self, client):
+    def test_delete_with_missing_blob(self, logged_client, auth_user, mock_azure):
         """Test graceful handling when blob is missing."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         attachment = Attachment.objects.create(
             task=task,
             file_name="missing.pdf",
@@ -646,24 +538,19 @@ class TestAttachmentDeleteView:
         
         attachment_id = attachment.id
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:delete", kwargs={'pk': attachment.pk})
+        url = _attachment_url("delete", attachment.pk)
         
-        with patch('attachments.views.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.exists.return_value = False
-            
-            response = client.post(url, follow=True)
+        mock_azure.exists.return_value = False
         
-        assert response.status_code == 200
+        response = logged_client.post(url)
+        
+        assert response.status_code == 302
         assert not Attachment.objects.filter(id=attachment_id).exists()
-        mock_storage.delete.assert_not_called()
+        mock_azure.delete.assert_not_called()
     
-    def test_delete_redirects_to_task_detail(self, client):
+    def test_delete_redirects_to_task_detail(self, logged_client, auth_user, mock_azure):
         """Test that delete redirects to task detail page."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         attachment = Attachment.objects.create(
             task=task,
             file_name="file.pdf",
@@ -672,23 +559,16 @@ class TestAttachmentDeleteView:
             content_type="application/pdf"
         )
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:delete", kwargs={'pk': attachment.pk})
+        url = _attachment_url("delete", attachment.pk)
         
-        with patch('attachments.views.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.exists.return_value = True
-            
-            response = client.post(url)
+        response = logged_client.post(url)
         
         assert response.status_code == 302
         assert response.url == reverse('tasks:detail', kwargs={'pk': task.pk})
     
-    def test_delete_shows_success_message(self, client):
+    def test_delete_shows_success_message(self, logged_client, auth_user, mock_azure):
         """Test that delete shows success message."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
         attachment = Attachment.objects.create(
             task=task,
             file_name="file.pdf",
@@ -697,15 +577,9 @@ class TestAttachmentDeleteView:
             content_type="application/pdf"
         )
         
-        client.login(username=user.email, password="testpass123")
-        url = reverse("attachments:delete", kwargs={'pk': attachment.pk})
+        url = _attachment_url("delete", attachment.pk)
         
-        with patch('attachments.signals.AzureBlobStorage') as MockStorage:
-            mock_storage = Mock()
-            MockStorage.return_value = mock_storage
-            mock_storage.exists.return_value = True
-            
-            response = client.post(url, follow=True)
+        response = logged_client.post(url, follow=True)
         
         # Verify successful deletion and redirect
         assert response.status_code == 200
@@ -0,0 +1,44 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+from contextlib import contextmanager
+
+import pytest
+
+from tests.tasks.factories import UserFactory
+
+
+@pytest.fixture(scope="session")
+def committed(django_db_setup, django_db_blocker):
+    """
+    Context manager that creates a row outside the per-test transaction.
+
+    ``with committed(factory, **kwargs) as obj`` commits the object so
+    broader-scoped fixtures can share it, and deletes it again on exit.
+    Tests must not modify the shared object.
+    """
+    @contextmanager
+    def _committed(factory, **kwargs):
+        with django_db_blocker.unblock():
+            obj = factory(**kwargs)
+        try:
+            yield obj
+        finally:
+            with django_db_blocker.unblock():
+                obj.delete()
+
+    return _committed
+
+
+@pytest.fixture(scope="module")
+def auth_user(committed):
+    """Create one user per test module for views that only need a logged-in user."""
+    with committed(UserFactory) as user:
+        yield user
+
+
+@pytest.fixture
+def logged_client(client, auth_user):
+    """Test client logged in as ``auth_user`` without a password check."""
+    client.force_login(auth_user)
+    return client
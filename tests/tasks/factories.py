@@ -2,6 +2,8 @@
 Factory classes for generating test data.
 """
 
+from datetime import timedelta
+
 import factory
 from django.utils import timezone
 
@@ -14,19 +16,13 @@ class UserFactory(factory.django.DjangoModelFactory):
 
     class Meta:
         model = User
-        skip_postgeneration_save = True
 
     email = factory.Sequence(lambda n: f"user{n}@example.com")
     username = factory.Sequence(lambda n: f"user{n}")
     first_name = factory.Faker("first_name")
     last_name = factory.Faker("last_name")
-
-    @factory.post_generation
-    def password(obj, create, extracted, **kwargs):
-        """Set password after user creation."""
-        if create:
-            obj.set_password(extracted or "testpass123")
-            obj.save()
+    # Hashed before the INSERT, so no second save is needed
+    password = factory.django.Password("testpass123")
 
 
 class TaskFactory(factory.django.DjangoModelFactory):
@@ -35,9 +31,24 @@ class TaskFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Task
 
+    class Params:
+        completed = factory.Trait(
+            status="completed", completed_at=factory.LazyFunction(timezone.now)
+        )
+
     title = factory.Sequence(lambda n: f"Task {n}")
-    description = factory.Faker("paragraph")
+    description = factory.Sequence(lambda n: f"Description {n}")
     owner = factory.SubFactory(UserFactory)
     priority = "medium"
     status = "pending"
-    due_date = factory.Faker("future_date", end_date="+30d")
+    due_date = factory.LazyFunction(lambda: timezone.now().date() + timedelta(days=7))
+
+    @classmethod
+    def create_batch_bulk(cls, size, **kwargs):
+        """
+        Create ``size`` tasks with a single INSERT.
+
+        Pass a saved ``owner``; built instances skip Task.save(), so
+        completed_at is only set when given (e.g. via the completed trait).
+        """
+        return Task.objects.bulk_create(cls.build_batch(size, **kwargs))
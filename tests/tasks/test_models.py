@@ -2,117 +2,125 @@
 Tests for Task model.
 """
 
+from datetime import date, datetime, timedelta
+
 import pytest
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 from tasks.models import Task
-from tests.tasks.factories import TaskFactory, UserFactory
+from tests.tasks.factories import TaskFactory
+
+
+pytestmark = pytest.mark.xdist_group(name="task_models")
+
+
+_TITLE_TOO_LONG = "x" * 201
+_DESC_TOO_LONG = "x" * 2001
 
 
 @pytest.mark.django_db
 class TestTaskModel:
     """Test cases for Task model."""
 
-    def test_task_creation_with_required_fields(self):
-        """Test creating task with only required fields."""
-        user = UserFactory()
-        task = Task.objects.create(title="Test Task", owner=user)
+    def test_task_field_defaults(self):
+        """Test field defaults applied when building a task in memory."""
+        task = Task(title="Test Task")
 
         assert task.title == "Test Task"
-        assert task.owner == user
         assert task.priority == "medium"  # Default
         assert task.status == "pending"  # Default
         assert task.description == ""
         assert task.due_date is None
         assert task.completed_at is None
+
+    def test_task_creation_with_required_fields(self, auth_user):
+        """Test creating task with only required fields sets timestamps."""
+        task = Task.objects.create(title="Test Task", owner=auth_user)
+
+        assert task.owner == auth_user
         assert task.created_at is not None
         assert task.updated_at is not None
 
-    def test_task_creation_with_all_fields(self):
+    def test_task_creation_with_all_fields(self, auth_user):
         """Test creating task with all fields."""
-        user = UserFactory()
         task = Task.objects.create(
             title="Complete Project",
             description="Finish the Django project",
-            owner=user,
+            owner=auth_user,
             priority="high",
             status="pending",
-            due_date=timezone.now().date(),
+            due_date=date(2024, 1, 1),
         )
 
         assert task.title == "Complete Project"
         assert task.description == "Finish the Django project"
         assert task.priority == "high"
         assert task.status == "pending"
-        assert task.due_date is not None
+        assert task.due_date == date(2024, 1, 1)
 
-    def test_task_title_validation_empty(self):
+    def test_task_title_validation_empty(self, auth_user):
         """Test that empty title raises validation error."""
-        user = UserFactory()
-        task = Task(title="   ", owner=user)
+        task = Task(title="   ", owner=auth_user)
 
         with pytest.raises(ValidationError) as exc:
             task.full_clean()
 
         assert "Title cannot be empty" in str(exc.value)
 
-    def test_task_title_validation_too_long(self):
+    def test_task_title_validation_too_long(self, auth_user):
         """Test that title over 200 chars raises validation error."""
-        user = UserFactory()
-        task = Task(title="x" * 201, owner=user)
+        task = Task(title=_TITLE_TOO_LONG, owner=auth_user)
 
         with pytest.raises(ValidationError) as exc:
             task.full_clean()
 
         assert "Title cannot exceed 200 characters" in str(exc.value)
 
-    def test_task_description_validation_too_long(self):
+    def test_task_description_validation_too_long(self, auth_user):
         """Test that description over 2000 chars raises validation error."""
-        user = UserFactory()
-        task = Task(title="Test", description="x" * 2001, owner=user)
+        task = Task(title="Test", description=_DESC_TOO_LONG, owner=auth_user)
 
         with pytest.raises(ValidationError) as exc:
             task.full_clean()
 
         assert "Description cannot exceed 2000 characters" in str(exc.value)
 
-    def test_task_owner_foreign_key(self):
+    def test_task_owner_foreign_key(self, auth_user, django_assert_num_queries):
         """Test that task is linked to owner via foreign key."""
-        user = UserFactory()
-        task = TaskFactory(owner=user)
+        task = TaskFactory(owner=auth_user)
 
-        assert task.owner == user
-        assert task in user.tasks.all()
+        assert task.owner == auth_user
+        with django_assert_num_queries(1):
+            assert auth_user.tasks.filter(pk=task.pk).exists()
 
-    def test_task_default_values(self):
+    def test_task_default_values(self, auth_user):
         """Test default values for priority and status."""
-        task = TaskFactory()
+        task = TaskFactory(owner=auth_user)
 
         assert task.priority == "medium"
         assert task.status == "pending"
 
-    def test_task_string_representation(self):
+    def test_task_string_representation(self, auth_user):
         """Test __str__ method."""
-        task = TaskFactory(title="My Task", status="pending")
+        task = TaskFactory(owner=auth_user, title="My Task", status="pending")
 
         assert str(task) == "My Task (Pending)"
 
-    def test_completed_at_auto_set_on_completion(self):
+    def test_completed_at_auto_set_on_completion(self, auth_user):
         """Test that completed_at is auto-set when status changes to completed."""
-        task = TaskFactory(status="pending")
+        task = TaskFactory(owner=auth_user, status="pending")
         assert task.completed_at is None
 
         task.status = "completed"
         task.save()
 
         assert task.completed_at is not None
-        assert isinstance(task.completed_at, type(timezone.now()))
+        assert isinstance(task.completed_at, datetime)
 
-    def test_completed_at_cleared_when_reopened(self):
+    def test_completed_at_cleared_when_reopened(self, auth_user):
         """Test that completed_at is cleared when status changes back to pending."""
-        task = TaskFactory(status="completed")
-        task.save()  # This should set completed_at
+        task = TaskFactory(owner=auth_user, completed=True)
 
         assert task.completed_at is not None
 
@@ -121,13 +129,15 @@ class TestTaskModel:
 
         assert task.completed_at is None
 
-    def test_task_ordering(self):
+    def test_task_ordering(self, auth_user):
         """Test that tasks are ordered by created_at descending (newest first)."""
-        user = UserFactory()
-        task1 = TaskFactory(owner=user, title="Old Task")
-        task2 = TaskFactory(owner=user, title="New Task")
+        task1, task2 = TaskFactory.create_batch_bulk(2, owner=auth_user)
+        # bulk_create still stamps auto_now_add, so backdate the first task
+        Task.objects.filter(pk=task1.pk).update(
+            created_at=timezone.now() - timedelta(days=1)
+        )
 
-        tasks = Task.objects.filter(owner=user)
+        tasks = Task.objects.filter(owner=auth_user)
 
         assert tasks[0] == task2  # Newest first
         assert tasks[1] == task1
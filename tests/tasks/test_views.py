@@ -3,41 +3,78 @@ Tests for Task views.
 """
 
 import pytest
-from django.urls import reverse
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.http import Http404
+from django.urls import reverse, reverse_lazy
+from pytest_django.asserts import assertRedirects
 
 from tasks.models import Task
+from tasks.views import (
+    TaskCreateView,
+    TaskDeleteView,
+    TaskDetailView,
+    TaskUpdateView,
+)
 from tests.tasks.factories import TaskFactory, UserFactory
 
 
-@pytest.mark.django_db
-class TestTaskCreateView:
-    """Test cases for TaskCreateView."""
+CREATE_URL = reverse_lazy("tasks:create")
+LIST_URL = reverse_lazy("tasks:list")
+# Session, user, paginator count, three statistics counts, current page rows
+LIST_VIEW_QUERIES = 7
+
+
+def _task_url(name, pk):
+    """Reverse a per-task URL (detail, edit or delete)."""
+    return reverse(f"tasks:{name}", kwargs={"pk": pk})
 
-    def test_create_view_requires_authentication(self, client):
-        """Test that create view requires login."""
-        url = reverse("tasks:create")
+
+class TestTaskViewsRequireAuthentication:
+    """Test that every task view redirects anonymous users to login."""
+
+    @pytest.mark.parametrize(
+        "url_name,kwargs",
+        [
+            ("tasks:create", {}),
+            ("tasks:list", {}),
+            ("tasks:detail", {"pk": 1}),
+            ("tasks:edit", {"pk": 1}),
+            ("tasks:delete", {"pk": 1}),
+        ],
+    )
+    def test_view_requires_authentication(self, client, url_name, kwargs):
+        """Test that the view requires login before looking up any task."""
+        url = reverse(url_name, kwargs=kwargs)
         response = client.get(url)
 
-        assert response.status_code == 302  # Redirect to login
-        assert "/accounts/login/" in response.url
+        assertRedirects(
+            response, f"{settings.LOGIN_URL}?next={url}", fetch_redirect_response=False
+        )
+
+
+class TestTaskViewsNoDB:
+    """Test views that render without touching the database."""
 
-    def test_create_view_get_authenticated(self, client):
+    def test_create_view_get_authenticated(self, rf):
         """Test GET request to create view when authenticated."""
-        user = UserFactory(password="testpass123")
+        request = rf.get(CREATE_URL)
+        request.user = UserFactory.build()
 
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:create")
-        response = client.get(url)
+        response = TaskCreateView.as_view()(request)
+        response.render()
 
         assert response.status_code == 200
-        assert "form" in response.context
+        assert "form" in response.context_data
 
-    def test_create_view_post_valid_data(self, client):
-        """Test POST request with valid data creates task."""
-        user = UserFactory(password="testpass123")
 
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:create")
+@pytest.mark.django_db(transaction=False)
+class TestTaskCreateView:
+    """Test cases for TaskCreateView."""
+
+    def test_create_view_post_valid_data(self, logged_client, auth_user):
+        """Test POST request with valid data creates task."""
+        url = CREATE_URL
 
         data = {
             "title": "New Task",
@@ -45,344 +82,271 @@ class TestTaskCreateView:
             "priority": "high",
             "status": "pending",
         }
-        response = client.post(url, data)
+        response = logged_client.post(url, data)
 
         assert response.status_code == 302  # Redirect after success
-        assert Task.objects.filter(title="New Task").exists()
-
-        task = Task.objects.get(title="New Task")
-        assert task.owner == user  # Owner auto-set
+        task = Task.objects.filter(title="New Task").first()
+        assert task is not None
+        assert task.owner == auth_user  # Owner auto-set
 
-    def test_create_view_post_invalid_data(self, client):
+    def test_create_view_post_invalid_data(self, logged_client, auth_user):
         """Test POST request with invalid data shows errors."""
-        user = UserFactory(password="testpass123")
-
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:create")
+        url = CREATE_URL
 
         data = {"title": "", "priority": "medium", "status": "pending"}  # Empty title
-        response = client.post(url, data)
+        response = logged_client.post(url, data)
 
         assert response.status_code == 200  # Re-render form
         assert "form" in response.context
         assert response.context["form"].errors
-        assert not Task.objects.filter(owner=user).exists()
+        assert not Task.objects.filter(owner=auth_user).exists()
 
-    def test_create_view_owner_auto_set(self, client):
+    def test_create_view_owner_auto_set(self, logged_client, auth_user):
         """Test that owner is automatically set to logged-in user."""
-        user = UserFactory(password="testpass123")
-
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:create")
+        url = CREATE_URL
 
         data = {"title": "Auto Owner Task", "priority": "medium", "status": "pending"}
-        response = client.post(url, data)
+        response = logged_client.post(url, data)
 
         task = Task.objects.get(title="Auto Owner Task")
-        assert task.owner == user
+        assert task.owner == auth_user
 
-    def test_create_view_success_message(self, client):
+    def test_create_view_success_message(self, logged_client):
         """Test that success message is displayed after creating task."""
-        user = UserFactory(password="testpass123")
-
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:create")
+        url = CREATE_URL
 
         data = {
             "title": "Task with Message",
             "priority": "medium",
             "status": "pending",
         }
-        response = client.post(url, data, follow=True)
+        response = logged_client.post(url, data, follow=True)
 
         messages = list(response.context["messages"])
         assert len(messages) > 0
         assert "created successfully" in str(messages[0]).lower()
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 class TestTaskListView:
     """Test cases for TaskListView."""
 
-    def test_list_view_requires_authentication(self, client):
-        """Test that list view requires login."""
-        url = reverse("tasks:list")
-        response = client.get(url)
-
-        assert response.status_code == 302
-        assert "/accounts/login/" in response.url
-
-    def test_list_view_shows_user_tasks_only(self, client):
+    def test_list_view_shows_user_tasks_only(
+        self, logged_client, auth_user, django_assert_num_queries
+    ):
         """Test that users only see their own tasks."""
-        user1 = UserFactory(password="testpass123")
-        user2 = UserFactory(password="testpass123")
+        user2 = UserFactory()
 
-        task1 = TaskFactory(owner=user1, title="User 1 Task")
+        task1 = TaskFactory(owner=auth_user, title="User 1 Task")
         task2 = TaskFactory(owner=user2, title="User 2 Task")
 
-        client.login(username=user1.email, password="testpass123")
-        url = reverse("tasks:list")
-        response = client.get(url)
+        url = LIST_URL
+        with django_assert_num_queries(LIST_VIEW_QUERIES):
+            response = logged_client.get(url)
 
         assert response.status_code == 200
-        assert task1 in response.context["tasks"]
-        assert task2 not in response.context["tasks"]
+        tasks = list(response.context["tasks"])
+        assert task1 in tasks
+        assert task2 not in tasks
 
-    def test_list_view_filter_by_status(self, client):
+    def test_list_view_filter_by_status(self, logged_client, auth_user):
         """Test filtering tasks by status."""
-        user = UserFactory(password="testpass123")
-        task1 = TaskFactory(owner=user, status="pending")
-        task2 = TaskFactory(owner=user, status="completed")
+        task1 = TaskFactory(owner=auth_user, status="pending")
+        task2 = TaskFactory(owner=auth_user, status="completed")
 
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:list") + "?status=pending"
-        response = client.get(url)
+        url = f"{LIST_URL}?status=pending"
+        response = logged_client.get(url)
 
         tasks = list(response.context["tasks"])
         assert task1 in tasks
         assert task2 not in tasks
 
-    def test_list_view_filter_by_priority(self, client):
+    def test_list_view_filter_by_priority(self, logged_client, auth_user):
         """Test filtering tasks by priority."""
-        user = UserFactory(password="testpass123")
-        task1 = TaskFactory(owner=user, priority="high")
-        task2 = TaskFactory(owner=user, priority="low")
+        task1 = TaskFactory(owner=auth_user, priority="high")
+        task2 = TaskFactory(owner=auth_user, priority="low")
 
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:list") + "?priority=high"
-        response = client.get(url)
+        url = f"{LIST_URL}?priority=high"
+        response = logged_client.get(url)
 
         tasks = list(response.context["tasks"])
         assert task1 in tasks
         assert task2 not in tasks
 
-    def test_list_view_statistics(self, client):
+    def test_list_view_statistics(
+        self, logged_client, auth_user, django_assert_num_queries
+    ):
         """Test that statistics are displayed correctly."""
-        user = UserFactory(password="testpass123")
-        TaskFactory.create_batch(3, owner=user, status="pending")
-        TaskFactory.create_batch(2, owner=user, status="completed")
+        Task.objects.bulk_create(
+            TaskFactory.build_batch(3, owner=auth_user, status="pending")
+            + TaskFactory.build_batch(2, owner=auth_user, status="completed")
+        )
 
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:list")
-        response = client.get(url)
+        url = LIST_URL
+        with django_assert_num_queries(LIST_VIEW_QUERIES):
+            response = logged_client.get(url)
 
         assert response.context["total_tasks"] == 5
         assert response.context["pending_count"] == 3
         assert response.context["completed_count"] == 2
 
-    def test_list_view_pagination(self, client):
+    def test_list_view_pagination(
+        self, logged_client, auth_user, django_assert_num_queries
+    ):
         """Test that pagination works correctly."""
-        user = UserFactory(password="testpass123")
-        TaskFactory.create_batch(25, owner=user)
+        TaskFactory.create_batch_bulk(25, owner=auth_user)
 
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:list")
-        response = client.get(url)
+        url = LIST_URL
+        with django_assert_num_queries(LIST_VIEW_QUERIES):
+            response = logged_client.get(url)
 
         assert response.context["is_paginated"]
         assert len(response.context["tasks"]) == 20
 
-    def test_list_view_empty_state(self, client):
+    def test_list_view_empty_state(self, logged_client):
         """Test empty state when no tasks exist."""
-        user = UserFactory(password="testpass123")
-
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:list")
-        response = client.get(url)
+        url = LIST_URL
+        response = logged_client.get(url)
 
         assert response.status_code == 200
         assert len(response.context["tasks"]) == 0
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 class TestTaskDetailView:
     """Test cases for TaskDetailView."""
 
-    def test_detail_view_requires_authentication(self, client):
-        """Test that detail view requires login."""
-        task = TaskFactory()
-        url = reverse("tasks:detail", kwargs={"pk": task.pk})
-        response = client.get(url)
-
-        assert response.status_code == 302
-        assert "/accounts/login/" in response.url
-
-    def test_detail_view_shows_task(self, client):
+    def test_detail_view_shows_task(self, logged_client, auth_user):
         """Test that task details are displayed."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user, title="Test Task")
+        task = TaskFactory(owner=auth_user, title="Test Task")
 
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:detail", kwargs={"pk": task.pk})
-        response = client.get(url)
+        url = _task_url("detail", task.pk)
+        response = logged_client.get(url)
 
         assert response.status_code == 200
         assert response.context["task"] == task
 
-    def test_detail_view_denies_other_users(self, client):
+    def test_detail_view_denies_other_users(self, rf, auth_user):
         """Test that users cannot view other users' tasks."""
-        user1 = UserFactory(password="testpass123")
-        user2 = UserFactory(password="testpass123")
+        user2 = UserFactory()
         task = TaskFactory(owner=user2)
 
-        client.login(username=user1.email, password="testpass123")
-        url = reverse("tasks:detail", kwargs={"pk": task.pk})
-        response = client.get(url)
+        request = rf.get(_task_url("detail", task.pk))
+        request.user = auth_user
 
-        assert response.status_code == 404
+        with pytest.raises(Http404):
+            TaskDetailView.as_view()(request, pk=task.pk)
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 class TestTaskUpdateView:
     """Test cases for TaskUpdateView."""
 
-    def test_update_view_requires_authentication(self, client):
-        """Test that update view requires login."""
-        task = TaskFactory()
-        url = reverse("tasks:edit", kwargs={"pk": task.pk})
-        response = client.get(url)
-
-        assert response.status_code == 302
-        assert "/accounts/login/" in response.url
+    @pytest.fixture
+    def task(self, auth_user):
+        """Task owned by the logged-in user, fresh for each test."""
+        return TaskFactory(owner=auth_user)
 
-    def test_update_view_get_authenticated(self, client):
+    def test_update_view_get_authenticated(self, logged_client, task):
         """Test GET request to update view."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
-
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:edit", kwargs={"pk": task.pk})
-        response = client.get(url)
+        url = _task_url("edit", task.pk)
+        response = logged_client.get(url)
 
         assert response.status_code == 200
         assert "form" in response.context
         assert response.context["task"] == task
 
-    def test_update_view_post_valid_data(self, client):
+    def test_update_view_post_valid_data(self, logged_client, task):
         """Test POST request with valid data updates task."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user, title="Old Title")
-
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:edit", kwargs={"pk": task.pk})
+        url = _task_url("edit", task.pk)
         data = {
             "title": "New Title",
             "priority": "high",
             "status": "completed",
         }
-        response = client.post(url, data)
+        response = logged_client.post(url, data)
 
         assert response.status_code == 302
 
-        task.refresh_from_db()
-        assert task.title == "New Title"
-        assert task.priority == "high"
-        assert task.status == "completed"
+        row = Task.objects.values("title", "priority", "status").get(pk=task.pk)
+        assert row == data
 
-    def test_update_view_denies_other_users(self, client):
+    def test_update_view_denies_other_users(self, rf, auth_user):
         """Test that users cannot edit other users' tasks."""
-        user1 = UserFactory(password="testpass123")
-        user2 = UserFactory(password="testpass123")
+        user2 = UserFactory()
         task = TaskFactory(owner=user2)
 
-        client.login(username=user1.email, password="testpass123")
-        url = reverse("tasks:edit", kwargs={"pk": task.pk})
-        response = client.get(url)
+        request = rf.get(_task_url("edit", task.pk))
+        request.user = auth_user
 
-        assert response.status_code == 404
+        with pytest.raises(Http404):
+            TaskUpdateView.as_view()(request, pk=task.pk)
 
-    def test_update_view_success_message(self, client):
+    def test_update_view_success_message(self, logged_client, task):
         """Test success message is displayed."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
-
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:edit", kwargs={"pk": task.pk})
+        url = _task_url("edit", task.pk)
         data = {
             "title": "Updated Task",
             "priority": "medium",
             "status": "pending",
         }
-        response = client.post(url, data, follow=True)
+        response = logged_client.post(url, data)
 
-        # Verify successful redirect to detail page
-        assert response.status_code == 200
-        task.refresh_from_db()
-        assert task.title == "Updated Task"
+        assert response.status_code == 302
+        messages = [str(m) for m in get_messages(response.wsgi_request)]
+        assert messages == ["Task updated successfully!"]
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=False)
 class TestTaskDeleteView:
     """Test cases for TaskDeleteView."""
 
-    def test_delete_view_requires_authentication(self, client):
-        """Test that delete view requires login."""
-        task = TaskFactory()
-        url = reverse("tasks:delete", kwargs={"pk": task.pk})
-        response = client.get(url)
-
-        assert response.status_code == 302
-        assert "/accounts/login/" in response.url
+    @pytest.fixture
+    def task(self, auth_user):
+        """Task owned by the logged-in user, fresh for each test."""
+        return TaskFactory(owner=auth_user)
 
-    def test_delete_view_get_shows_confirmation(self, client):
+    def test_delete_view_get_shows_confirmation(self, logged_client, task):
         """Test GET request shows confirmation page."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
-
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:delete", kwargs={"pk": task.pk})
-        response = client.get(url)
+        url = _task_url("delete", task.pk)
+        response = logged_client.get(url)
 
         assert response.status_code == 200
         assert response.context["task"] == task
 
-    def test_delete_view_post_deletes_task(self, client):
+    def test_delete_view_post_deletes_task(self, logged_client, task):
         """Test POST request deletes the task."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
         task_pk = task.pk
 
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:delete", kwargs={"pk": task.pk})
-        response = client.post(url)
+        url = _task_url("delete", task.pk)
+        response = logged_client.post(url)
 
         assert response.status_code == 302
         assert not Task.objects.filter(pk=task_pk).exists()
 
-    def test_delete_view_denies_other_users(self, client):
+    def test_delete_view_denies_other_users(self, rf, auth_user):
         """Test that users cannot delete other users' tasks."""
-        user1 = UserFactory(password="testpass123")
-        user2 = UserFactory(password="testpass123")
+        user2 = UserFactory()
         task = TaskFactory(owner=user2)
 
-        client.login(username=user1.email, password="testpass123")
-        url = reverse("tasks:delete", kwargs={"pk": task.pk})
-        response = client.get(url)
+        request = rf.get(_task_url("delete", task.pk))
+        request.user = auth_user
 
-        assert response.status_code == 404
+        with pytest.raises(Http404):
+            TaskDeleteView.as_view()(request, pk=task.pk)
 
-    def test_delete_view_success_message(self, client):
+    def test_delete_view_success_message(self, logged_client, task):
         """Test success message is displayed."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
-        task_pk = task.pk
-
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:delete", kwargs={"pk": task.pk})
-        response = client.post(url, follow=True)
+        url = _task_url("delete", task.pk)
+        response = logged_client.post(url)
 
-        # Verify successful redirect and deletion
-        assert response.status_code == 200
-        assert not Task.objects.filter(pk=task_pk).exists()
+        assert response.status_code == 302
+        messages = [str(m) for m in get_messages(response.wsgi_request)]
+        assert messages == ["Task deleted successfully!"]
 
-    def test_delete_view_redirects_to_list(self, client):
+    def test_delete_view_redirects_to_list(self, logged_client, task):
         """Test that delete redirects to task list."""
-        user = UserFactory(password="testpass123")
-        task = TaskFactory(owner=user)
-
-        client.login(username=user.email, password="testpass123")
-        url = reverse("tasks:delete", kwargs={"pk": task.pk})
-        response = client.post(url)
+        url = _task_url("delete", task.pk)
+        response = logged_client.post(url)
 
-        assert response.status_code == 302
-        assert response.url == reverse("tasks:list")
+        assertRedirects(response, str(LIST_URL), fetch_redirect_response=False)